@@ -1,18 +1,45 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import pandas as pd
 import numpy as np
-from sklearn.impute import SimpleImputer
+import orjson
+import ahocorasick
+from numba import njit
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
 import os
+import copy
+import json
+import hashlib
+import functools
+import heapq
+from datetime import datetime
 from dotenv import load_dotenv
 import logging
 
 # Load environment variables
 load_dotenv()
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, with native NumPy support"""
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    
+    def dumpb(self, obj):
+        return orjson.dumps(obj, default=self.default, option=self.option)
+    
+    def dumps(self, obj, **kwargs):
+        return self.dumpb(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumpb(obj), mimetype=self.mimetype)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 # CORS(app)
 
 # Configure logging
@@ -22,6 +49,10 @@ logger = logging.getLogger(__name__)
 # Configuration
 PORT = int(os.getenv('AI_PORT', 5001))
 DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
+STREAM_BATCH_ROWS = 1000  # Records serialized per chunk of a streamed response
+
+# Numeric material attributes handled by imputation and outlier detection
+NUMERIC_COLUMNS = ['quantity', 'energy_consumption', 'transport_distance']
 
 # Material categorization mapping
 MATERIAL_CATEGORIES = {
@@ -35,6 +66,47 @@ MATERIAL_CATEGORIES = {
     'ceramics': ['ceramic', 'porcelain', 'clay']
 }
 
+# Flat keyword -> titled category lookup, in MATERIAL_CATEGORIES order
+KEYWORD_TO_CATEGORY = {
+    keyword: category.title()
+    for category, keywords in MATERIAL_CATEGORIES.items()
+    for keyword in keywords
+}
+
+# Aho-Corasick automaton over the same keywords for single-pass lookups;
+# the stored priority keeps the first-listed keyword winning on multiple hits
+KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for priority, (keyword, category) in enumerate(KEYWORD_TO_CATEGORY.items()):
+    KEYWORD_AUTOMATON.add_word(keyword, (priority, keyword, category))
+KEYWORD_AUTOMATON.make_automaton()
+
+def char_mask(text):
+    """Bitmask of the a-z letters in text, plus the set of its other characters"""
+    mask = 0
+    other_chars = set()
+    for char in set(text):
+        if 'a' <= char <= 'z':
+            mask |= 1 << (ord(char) - ord('a'))
+        else:
+            other_chars.add(char)
+    return mask, frozenset(other_chars)
+
+# a-z bitmask of each keyword's characters for vectorized fuzzy scoring; any
+# other characters (spaces, digits, ...) are kept aside for an exact Jaccard
+KEYWORD_CHARS = [char_mask(keyword) for keyword in KEYWORD_TO_CATEGORY]
+KEYWORD_MASKS = np.array([mask for mask, _ in KEYWORD_CHARS], dtype=np.uint32)
+KEYWORD_OTHER_COUNTS = np.array([len(other) for _, other in KEYWORD_CHARS], dtype=np.int64)
+KEYWORDS_WITH_OTHER_CHARS = [(i, other) for i, (_, other) in enumerate(KEYWORD_CHARS) if other]
+KEYWORD_CATEGORIES = list(KEYWORD_TO_CATEGORY.values())
+
+# Energy consumption factors (MJ/kg) by material keyword
+ENERGY_FACTORS = {
+    'steel': 24.0, 'aluminum': 154.0, 'copper': 42.0,
+    'plastic': 76.0, 'pet': 76.0, 'hdpe': 76.7,
+    'glass': 15.0, 'concrete': 1.0, 'wood': 2.5,
+    'paper': 20.0, 'cotton': 55.0, 'polyester': 125.0
+}
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -42,7 +114,7 @@ def health_check():
         'status': 'healthy',
         'service': 'AI Processor',
         'version': '1.0.0',
-        'timestamp': pd.Timestamp.now().isoformat()
+        'timestamp': datetime.now().isoformat()
     })
 
 @app.route('/process', methods=['POST'])
@@ -56,23 +128,22 @@ def process_materials():
         if not materials:
             return jsonify({'error': 'No materials provided'}), 400
         
-        # Convert to DataFrame for processing
-        df = pd.DataFrame(materials)
+        # Convert to column arrays for processing
+        columns = records_to_columns(materials)
         
         # Process the data
-        processed_df = perform_ai_processing(df, options)
+        processed = perform_ai_processing(columns, len(materials), options)
         
-        # Convert back to list of dictionaries
-        processed_materials = processed_df.to_dict('records')
+        processing_info = {
+            'total_records': len(materials),
+            'imputed_records': int(processed['ai_imputed'].sum()),
+            'categorized_records': int(processed['ai_categorized'].sum())
+        }
         
-        return jsonify({
-            'processed_materials': processed_materials,
-            'processing_info': {
-                'total_records': len(processed_materials),
-                'imputed_records': len([m for m in processed_materials if m.get('ai_imputed', False)]),
-                'categorized_records': len([m for m in processed_materials if m.get('ai_categorized', False)])
-            }
-        })
+        # Stream the records back instead of building the full list in memory
+        return Response(
+            stream_with_context(stream_processed_materials(processed, len(materials), processing_info)),
+            mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error processing materials: {str(e)}")
@@ -91,7 +162,7 @@ def generate_recommendations():
         return jsonify({
             'recommendations': recommendations,
             'confidence_score': calculate_recommendation_confidence(lca_results),
-            'generated_at': pd.Timestamp.now().isoformat()
+            'generated_at': datetime.now().isoformat()
         })
         
     except Exception as e:
@@ -105,17 +176,17 @@ def categorize_materials():
         data = request.get_json()
         materials = data.get('materials', [])
         
-        categorized = []
-        for material in materials:
-            material_name = material.get('material_type', '').lower()
-            category, confidence = intelligent_categorization(material_name)
-            
-            categorized.append({
+        categories, confidence = categorize_names([material.get('material_type', '') for material in materials])
+        
+        categorized = [
+            {
                 **material,
                 'category': category,
-                'confidence': confidence,
-                'ai_categorized': confidence < 0.9
-            })
+                'confidence': score,
+                'ai_categorized': score < 0.9
+            }
+            for material, category, score in zip(materials, categories.tolist(), confidence.tolist())
+        ]
         
         return jsonify({
             'categorized_materials': categorized,
@@ -126,164 +197,287 @@ def categorize_materials():
         logger.error(f"Error categorizing materials: {str(e)}")
         return jsonify({'error': 'Categorization failed', 'details': str(e)}), 500
 
-def perform_ai_processing(df, options):
+def records_to_columns(materials):
+    """Convert a list of material dicts into a dict of column arrays"""
+    size = len(materials)
+    keys = dict.fromkeys(key for material in materials for key in material)
+    
+    columns = {}
+    for key in keys:
+        if key in NUMERIC_COLUMNS:
+            columns[key] = np.fromiter(
+                (np.nan if material.get(key) is None else material[key] for material in materials),
+                dtype=np.float64, count=size)
+        else:
+            columns[key] = np.fromiter(
+                (material.get(key, np.nan) for material in materials), dtype=object, count=size)
+    
+    return columns
+
+def columns_to_records(columns):
+    """Convert a dict of column arrays back into a list of dicts"""
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*(values.tolist() for values in columns.values()))]
+
+def stream_processed_materials(columns, size, processing_info):
+    """Yield the /process response body as JSON chunks of records"""
+    yield b'{"processed_materials":['
+    
+    for start in range(0, size, STREAM_BATCH_ROWS):
+        batch = columns_to_records(
+            {col: values[start:start + STREAM_BATCH_ROWS] for col, values in columns.items()})
+        chunk = app.json.dumpb(batch)[1:-1]
+        yield chunk if start == 0 else b',' + chunk
+    
+    yield b'],"processing_info":' + app.json.dumpb(processing_info) + b'}'
+
+def perform_ai_processing(columns, size, options):
     """Main AI processing function"""
-    processed_df = df.copy()
+    # Copy the numeric attributes into one C-ordered block so each column is a
+    # contiguous float64 row view for the imputation and outlier kernels
+    numeric_columns = [col for col in columns if col in NUMERIC_COLUMNS]
+    numeric_block = np.empty((len(numeric_columns), size), dtype=np.float64, order='C')
+    numeric_rows = dict(zip(numeric_columns, numeric_block))
+    
+    processed = {}
+    for col, values in columns.items():
+        if col in numeric_rows:
+            numeric_rows[col][:] = values
+            processed[col] = numeric_rows[col]
+        else:
+            processed[col] = values.copy()
     
     # Add processing flags
-    processed_df['ai_imputed'] = False
-    processed_df['ai_categorized'] = False
-    processed_df['outlier_flag'] = False
-    processed_df['confidence_score'] = 1.0
-    
-    # 1. Missing data detection and imputation
-    processed_df = handle_missing_data(processed_df)
+    processed['ai_imputed'] = np.zeros(size, dtype=np.bool_)
+    processed['ai_categorized'] = np.zeros(size, dtype=np.bool_)
+    processed['outlier_flag'] = np.zeros(size, dtype=np.bool_)
+    processed['confidence_score'] = np.ones(size)
     
-    # 2. Outlier detection
-    processed_df = detect_outliers(processed_df)
+    # 1. Missing data imputation and outlier detection
+    processed = process_numeric_columns(processed)
     
-    # 3. Intelligent categorization
-    processed_df = enhance_categorization(processed_df)
+    # 2. Intelligent categorization
+    processed = enhance_categorization(processed)
     
-    # 4. Data validation and quality scoring
-    processed_df = calculate_data_quality(processed_df)
+    # 3. Data validation and quality scoring
+    processed = calculate_data_quality(processed)
     
-    return processed_df
+    return processed
 
-def handle_missing_data(df):
-    """Handle missing data with intelligent imputation"""
-    numeric_columns = ['quantity', 'energy_consumption', 'transport_distance']
-    
-    for col in numeric_columns:
-        if col in df.columns:
-            # Identify missing values
-            missing_mask = df[col].isna() | (df[col] == 0)
-            
-            if missing_mask.any():
-                # Use median imputation for robustness
-                imputer = SimpleImputer(strategy='median')
-                
-                # If all values are missing, use defaults
-                if missing_mask.all():
-                    if col == 'quantity':
-                        df[col] = 1.0
-                    elif col == 'energy_consumption':
-                        df[col] = df.apply(lambda row: estimate_energy_consumption(
-                            row.get('material_type', '')), axis=1)
-                    elif col == 'transport_distance':
-                        df[col] = 100.0  # Default 100km
-                else:
-                    # Use existing values to impute
-                    valid_values = df[col][~missing_mask].values.reshape(-1, 1)
-                    if len(valid_values) > 0:
-                        imputer.fit(valid_values)
-                        df.loc[missing_mask, col] = imputer.transform([[0]])[0][0]
-                
-                # Mark as imputed
-                df.loc[missing_mask, 'ai_imputed'] = True
-    
-    return df
-
-def detect_outliers(df):
-    """Detect outliers using statistical methods"""
-    numeric_columns = ['quantity', 'energy_consumption', 'transport_distance']
-    
-    for col in numeric_columns:
-        if col in df.columns and len(df[col].dropna()) > 0:
-            # Use IQR method for outlier detection
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
+def process_numeric_columns(columns):
+    """Impute missing data and detect outliers in one sweep per numeric column"""
+    size = len(columns['outlier_flag'])
+    outlier_reason = np.full(size, np.nan, dtype=object)
+    checked = False
+    
+    for col in NUMERIC_COLUMNS:
+        if col in columns:
+            values = columns[col]
+            missing_mask, outlier_mask = process_numeric(values)
             
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
+            # If all values are missing, use defaults
+            if missing_mask.all():
+                if col == 'quantity':
+                    values[:] = 1.0
+                elif col == 'energy_consumption':
+                    values[:] = estimate_energy_consumption(columns.get('material_type', [''] * size))
+                elif col == 'transport_distance':
+                    values[:] = 100.0  # Default 100km
+                outlier_mask = iqr_mask(values)
             
-            outlier_mask = (df[col] < lower_bound) | (df[col] > upper_bound)
-            df.loc[outlier_mask, 'outlier_flag'] = True
-            df.loc[outlier_mask, 'outlier_reason'] = f'Statistical outlier in {col}'
+            # Mark as imputed and flag outliers
+            columns['ai_imputed'] |= missing_mask
+            columns['outlier_flag'] |= outlier_mask
+            outlier_reason[outlier_mask] = f'Statistical outlier in {col}'
+            checked = True
     
-    return df
+    if checked:
+        columns['outlier_reason'] = outlier_reason
+    
+    return columns
+
+@njit(cache=True)
+def _lerp(a, b, t):
+    """Linear interpolation matching NumPy's quantile rounding"""
+    diff = b - a
+    if t >= 0.5:
+        return b - diff * (1 - t)
+    return a + diff * t
 
-def enhance_categorization(df):
+@njit(cache=True)
+def iqr_mask(values):
+    """Flag values outside 1.5 * IQR of the non-missing values"""
+    n = values.shape[0]
+    mask = np.zeros(n, dtype=np.bool_)
+    valid = values[~np.isnan(values)]
+    m = valid.shape[0]
+    if m == 0:
+        return mask
+    
+    # Quartiles by linear interpolation, using selection instead of a full sort
+    h1 = (m - 1) * 0.25
+    h3 = (m - 1) * 0.75
+    i1 = int(h1)
+    i3 = int(h3)
+    j1 = min(i1 + 1, m - 1)
+    j3 = min(i3 + 1, m - 1)
+    part = np.partition(valid, np.array([i1, j1, i3, j3]))
+    Q1 = _lerp(part[i1], part[j1], h1 - i1)
+    Q3 = _lerp(part[i3], part[j3], h3 - i3)
+    IQR = Q3 - Q1
+    
+    lower_bound = Q1 - 1.5 * IQR
+    upper_bound = Q3 + 1.5 * IQR
+    
+    for i in range(n):
+        mask[i] = values[i] < lower_bound or values[i] > upper_bound
+    return mask
+
+@njit(cache=True)
+def process_numeric(values):
+    """Median-impute missing (NaN or 0) values in place and flag IQR outliers"""
+    missing = np.isnan(values) | (values == 0)
+    
+    # Leave all-missing columns to the caller's defaults
+    if missing.all():
+        return missing, np.zeros(values.shape[0], dtype=np.bool_)
+    
+    # Use median of existing values for robustness
+    if missing.any():
+        values[missing] = np.median(values[~missing])
+    
+    return missing, iqr_mask(values)
+
+def enhance_categorization(columns):
     """Enhance material categorization with AI"""
-    if 'material_type' in df.columns:
-        for idx, row in df.iterrows():
-            material_name = str(row['material_type']).lower()
-            category, confidence = intelligent_categorization(material_name)
-            
-            df.at[idx, 'category'] = category
-            df.at[idx, 'confidence_score'] = confidence
-            
-            if confidence < 0.9:
-                df.at[idx, 'ai_categorized'] = True
+    if 'material_type' in columns:
+        categories, confidence = categorize_names(columns['material_type'])
+        
+        columns['category'] = categories
+        columns['confidence_score'] = confidence
+        columns['ai_categorized'] |= confidence < 0.9
     
-    return df
+    return columns
 
-def calculate_data_quality(df):
+def categorize_names(material_names):
+    """Categorize a sequence of material names, once per distinct name"""
+    names = pd.Series(material_names, dtype=object)
+    
+    # Missing names (null in the payload, NaN for absent keys) are uncategorized
+    names = names.where(names.notna(), '').map(str).str.lower().str.strip()
+    codes, distinct_names = pd.factorize(names)
+    
+    results = [intelligent_categorization(name) for name in distinct_names]
+    categories = np.array([category for category, _ in results], dtype=object)[codes]
+    confidence = np.array([score for _, score in results], dtype=np.float64)[codes]
+    
+    return categories, confidence
+
+def calculate_data_quality(columns):
     """Calculate overall data quality score"""
-    for idx, row in df.iterrows():
-        quality_score = 1.0
-        
-        # Reduce score for imputed data
-        if row.get('ai_imputed', False):
-            quality_score -= 0.2
-        
-        # Reduce score for outliers
-        if row.get('outlier_flag', False):
-            quality_score -= 0.1
-        
-        # Reduce score for uncertain categorization
-        if row.get('confidence_score', 1.0) < 0.8:
-            quality_score -= 0.1
-        
-        df.at[idx, 'data_quality_score'] = max(0.0, quality_score)
+    quality_score = np.ones(len(columns['ai_imputed']))
+    
+    # Reduce score for imputed data
+    quality_score -= 0.2 * columns['ai_imputed']
     
-    return df
+    # Reduce score for outliers
+    quality_score -= 0.1 * columns['outlier_flag']
+    
+    # Reduce score for uncertain categorization
+    quality_score -= 0.1 * (columns['confidence_score'] < 0.8)
+    
+    columns['data_quality_score'] = np.maximum(quality_score, 0.0)
+    
+    return columns
 
+@functools.lru_cache(maxsize=4096)
 def intelligent_categorization(material_name):
     """Intelligent material categorization with confidence scoring"""
     material_name = material_name.lower().strip()
     
     # Direct matches with high confidence
-    for category, keywords in MATERIAL_CATEGORIES.items():
-        for keyword in keywords:
-            if keyword in material_name:
-                confidence = 0.95 if material_name == keyword else 0.85
-                return category.title(), confidence
-    
-    # Fuzzy matching for partial matches
-    best_match_score = 0
-    best_category = 'Unknown'
-    
-    for category, keywords in MATERIAL_CATEGORIES.items():
-        for keyword in keywords:
-            # Simple similarity scoring
-            if any(char in material_name for char in keyword):
-                score = len(set(keyword) & set(material_name)) / len(set(keyword) | set(material_name))
-                if score > best_match_score and score > 0.3:
-                    best_match_score = score
-                    best_category = category.title()
-    
-    confidence = best_match_score if best_category != 'Unknown' else 0.1
-    return best_category, confidence
-
-def estimate_energy_consumption(material_type):
-    """Estimate energy consumption based on material type"""
-    energy_factors = {
-        'steel': 24.0, 'aluminum': 154.0, 'copper': 42.0,
-        'plastic': 76.0, 'pet': 76.0, 'hdpe': 76.7,
-        'glass': 15.0, 'concrete': 1.0, 'wood': 2.5,
-        'paper': 20.0, 'cotton': 55.0, 'polyester': 125.0
-    }
-    
-    material_lower = material_type.lower()
-    for material, factor in energy_factors.items():
+    matches = [match for _, match in KEYWORD_AUTOMATON.iter(material_name)]
+    if matches:
+        _, keyword, category = min(matches)
+        confidence = 0.95 if material_name == keyword else 0.85
+        return category, confidence
+    
+    # Fuzzy matching for partial matches: Jaccard similarity of the character
+    # sets, scored against every keyword at once on a-z bitmasks
+    name_mask, other_chars = char_mask(material_name)
+    shared = popcount32(KEYWORD_MASKS & name_mask).astype(np.int64)
+    union = popcount32(KEYWORD_MASKS | name_mask) + KEYWORD_OTHER_COUNTS + len(other_chars)
+    
+    # Non a-z characters the name shares with a keyword
+    for i, keyword_other in KEYWORDS_WITH_OTHER_CHARS:
+        common = len(keyword_other & other_chars)
+        shared[i] += common
+        union[i] -= common
+    
+    scores = shared / union
+    
+    best = scores.argmax()
+    if scores[best] > 0.3:
+        return KEYWORD_CATEGORIES[best], float(scores[best])
+    
+    return 'Unknown', 0.1
+
+def popcount32(x):
+    """SWAR population count of a uint32 array"""
+    x = x - ((x >> 1) & 0x55555555)
+    x = (x & 0x33333333) + ((x >> 2) & 0x33333333)
+    x = (x + (x >> 4)) & 0x0F0F0F0F
+    return (x * 0x01010101) >> 24
+
+def estimate_energy_consumption(material_types):
+    """Estimate energy consumption for a sequence of material types"""
+    materials = pd.Series(material_types, dtype=object)
+    materials = materials.where(materials.notna(), '').map(str).str.lower()
+    codes, distinct_materials = pd.factorize(materials)
+    
+    factors = np.array([energy_factor(material) for material in distinct_materials], dtype=np.float64)
+    return factors[codes]
+
+def energy_factor(material_lower):
+    """Energy factor of the first ENERGY_FACTORS keyword found in a material name"""
+    for material, factor in ENERGY_FACTORS.items():
         if material in material_lower:
             return factor
     
     return 10.0  # Default estimate
 
+class PayloadKey:
+    """Hashable stand-in for an LCA payload, compared by content digest"""
+    
+    def __init__(self, lca_results, context):
+        payload = json.dumps([lca_results, context], sort_keys=True, default=str).encode()
+        self.digest = hashlib.blake2b(payload, digest_size=16).digest()
+        self.payload = (lca_results, context)
+    
+    def __hash__(self):
+        return hash(self.digest)
+    
+    def __eq__(self, other):
+        return isinstance(other, PayloadKey) and self.digest == other.digest
+
 def generate_ai_recommendations(lca_results, context):
+    """Generate recommendations, reusing results for repeated payloads"""
+    recommendations = cached_recommendations(PayloadKey(lca_results, context))
+    
+    # Hand out copies so callers cannot mutate the cached entry
+    return copy.deepcopy(list(recommendations))
+
+@functools.lru_cache(maxsize=1024)
+def cached_recommendations(key):
+    """Build recommendations for a payload key and keep them as a tuple"""
+    lca_results, context = key.payload
+    
+    # The cache only needs the digest once the result is built
+    key.payload = None
+    
+    return tuple(build_ai_recommendations(lca_results, context))
+
+def build_ai_recommendations(lca_results, context):
     """Generate intelligent recommendations based on LCA results"""
     recommendations = []
     
@@ -328,7 +522,7 @@ def generate_ai_recommendations(lca_results, context):
     
     # Material-specific recommendations
     if material_breakdown:
-        high_impact_materials = sorted(material_breakdown, key=lambda x: x.get('total_impact', 0), reverse=True)[:3]
+        high_impact_materials = heapq.nlargest(3, material_breakdown, key=lambda x: x.get('total_impact', 0))
         
         for material in high_impact_materials:
             if material.get('total_impact', 0) > 20:
@@ -344,7 +538,7 @@ def generate_ai_recommendations(lca_results, context):
     
     # Category-based recommendations
     if category_breakdown:
-        high_impact_categories = sorted(category_breakdown, key=lambda x: x.get('co2', 0), reverse=True)[:2]
+        high_impact_categories = heapq.nlargest(2, category_breakdown, key=lambda x: x.get('co2', 0))
         
         for category in high_impact_categories:
             if category.get('co2', 0) > 30:
@@ -374,11 +568,9 @@ def generate_ai_recommendations(lca_results, context):
         'estimated_reduction': '5-20%'
     })
     
-    # Sort by impact score and priority
+    # Return top 6 recommendations by priority and impact score
     priority_order = {'high': 3, 'medium': 2, 'low': 1}
-    recommendations.sort(key=lambda x: (priority_order.get(x['priority'], 0), x.get('impact_score', 0)), reverse=True)
-    
-    return recommendations[:6]  # Return top 6 recommendations
+    return heapq.nlargest(6, recommendations, key=lambda x: (priority_order.get(x['priority'], 0), x.get('impact_score', 0)))
 
 def generate_carbon_reduction_actions(material_breakdown):
     """Generate specific carbon reduction actions based on materials"""
@@ -461,16 +653,22 @@ def generate_category_actions(category):
 
 def calculate_recommendation_confidence(lca_results):
     """Calculate confidence score for recommendations"""
+    material_count = len(lca_results.get('material_breakdown') or [])
+    warning_count = len(lca_results.get('warnings') or [])
+    
+    return recommendation_confidence(material_count, warning_count)
+
+@functools.lru_cache(maxsize=1024)
+def recommendation_confidence(material_count, warning_count):
+    """Confidence score from the amount of data and number of estimates"""
     base_confidence = 0.8
     
     # Increase confidence with more data
-    if lca_results.get('material_breakdown'):
-        material_count = len(lca_results['material_breakdown'])
+    if material_count:
         base_confidence += min(0.15, material_count * 0.02)
     
     # Decrease confidence if many estimates were used
-    if lca_results.get('warnings'):
-        warning_count = len(lca_results['warnings'])
+    if warning_count:
         base_confidence -= min(0.3, warning_count * 0.05)
     
     return round(base_confidence, 2)
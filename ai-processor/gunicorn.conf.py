@@ -0,0 +1,15 @@
+import multiprocessing
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Threaded workers so concurrent requests overlap the pandas/NumPy sections
+bind = f"0.0.0.0:{os.getenv('AI_PORT', 5001)}"
+worker_class = 'gthread'
+workers = int(os.getenv('AI_WORKERS', multiprocessing.cpu_count()))
+threads = int(os.getenv('AI_THREADS', 4))
+
+# Build the keyword lookups once in the master and share them with workers
+preload_app = True